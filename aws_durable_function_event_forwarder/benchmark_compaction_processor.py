@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Local benchmark of the CompactionProcessorFunction shipped inline in durable_function_event_forwarder.yaml.
+
+Feeds synthetic durable execution status change events through the processor in Firehose-sized
+batches and reports the processing throughput and the bytes saved compared to the raw envelopes.
+
+    python3 benchmark_compaction_processor.py [--records N] [--batch-size N] [--statuses S1,S2]
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import textwrap
+import time
+import uuid
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "durable_function_event_forwarder.yaml")
+STATUSES = ["RUNNING", "SUCCEEDED", "FAILED", "TIMED_OUT", "STOPPED"]
+
+
+def load_processor(statuses):
+    """Extract the inline processor code from the template and return its handler."""
+    with open(TEMPLATE) as f:
+        lines = f.read().splitlines()
+    start = lines.index("  CompactionProcessorFunction:")
+    start = next(i for i in range(start, len(lines)) if lines[i].strip() == "ZipFile: |") + 1
+    indent = len(lines[start]) - len(lines[start].lstrip())
+    end = next((i for i in range(start, len(lines)) if lines[i].strip() and len(lines[i]) - len(lines[i].lstrip()) < indent), len(lines))
+    os.environ["STATUSES"] = statuses
+    namespace = {}
+    exec(textwrap.dedent("\n".join(lines[start:end])), namespace)
+    return namespace["handler"]
+
+
+def make_event(index):
+    execution_id = uuid.uuid4()
+    function = f"arn:aws:lambda:us-east-1:123456789012:function:durable-function-{index % 50}"
+    status = random.choice(STATUSES)
+    detail = {
+        "durableExecutionArn": f"{function}:$LATEST/durable-execution/{execution_id}/{uuid.uuid4()}",
+        "durableExecutionName": f"order-{index}",
+        "functionArn": f"{function}:{index % 7 + 1}",
+        "status": status,
+        "startTimestamp": "2025-11-20T13:08:22.345Z",
+    }
+    if status != "RUNNING":
+        detail["endTimestamp"] = "2025-11-20T13:08:25.112Z"
+    return {
+        "version": "0",
+        "id": str(uuid.uuid4()),
+        "detail-type": "Durable Execution Status Change",
+        "source": "aws.lambda",
+        "account": "123456789012",
+        "time": "2025-11-20T13:08:22Z",
+        "region": "us-east-1",
+        "resources": [],
+        "detail": detail,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--statuses", default="", help="Comma-separated Statuses parameter value")
+    args = parser.parse_args()
+
+    handler = load_processor(args.statuses)
+    random.seed(0)
+    # EventBridge delivers each envelope to Firehose as one JSON document.
+    raw = [json.dumps(make_event(i)).encode() for i in range(args.records)]
+    batches = [
+        {"records": [{"recordId": str(i), "data": base64.b64encode(data).decode()} for i, data in enumerate(raw[start:start + args.batch_size], start)]}
+        for start in range(0, len(raw), args.batch_size)
+    ]
+
+    results = []
+    started = time.perf_counter()
+    for batch in batches:
+        results += handler(batch, None)["records"]
+    elapsed = time.perf_counter() - started
+
+    delivered = [record for record in results if record["result"] == "Ok"]
+    bytes_in = sum(len(data) for data in raw)
+    bytes_out = sum(len(base64.b64decode(record["data"])) for record in delivered)
+    print(f"records:          {len(raw)} in {len(batches)} batches of {args.batch_size}")
+    print(f"throughput:       {len(raw) / elapsed:,.0f} records/s")
+    print(f"delivered:        {len(delivered)} ({len(raw) - len(delivered)} dropped)")
+    print(f"bytes in:         {bytes_in:,} ({bytes_in / len(raw):.0f} per record)")
+    print(f"bytes out:        {bytes_out:,} ({bytes_out / max(len(delivered), 1):.0f} per delivered record)")
+    print(f"bytes saved:      {bytes_in - bytes_out:,} ({(bytes_in - bytes_out) / bytes_in:.1%})")
+
+
+if __name__ == "__main__":
+    main()